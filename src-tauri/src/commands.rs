@@ -2373,6 +2373,7 @@ async fn run_pipeline_test(
             target_width: use_target_w,
             target_height: use_target_h,
             target_fps: use_target_fps,
+            low_latency: false,
         };
         match AsyncVideoEncoder::new(
             temp_file.clone(), capture.width, capture.height, capture.fps,
@@ -2714,6 +2715,7 @@ async fn run_auto_select_test(
             target_width: use_target_w,
             target_height: use_target_h,
             target_fps: use_target_fps,
+            low_latency: false,
         };
         
         let encoder = match AsyncVideoEncoder::new(
@@ -2743,14 +2745,14 @@ async fn run_auto_select_test(
             // Drain frames from the pre-roll buffer
             let frames = capture.drain_preroll_frames();
             
-            for frame in &frames {
+            for frame in frames {
                 let raw_frame = RawVideoFrame {
-                    data: frame.data.clone(),
+                    data: frame.data,
                     pts: frame.pts,
                     duration: frame.duration,
                     width: capture.width,
                     height: capture.height,
-                    format: frame.pixel_format.clone().unwrap_or_else(|| pixel_format.clone()),
+                    format: frame.pixel_format.unwrap_or_else(|| pixel_format.clone()),
                     capture_time: frame.wall_time,
                 };
                 
@@ -45,15 +45,47 @@ impl Default for DeviceHealthState {
 // Lightweight enumerators (names only, for health checks)
 // ============================================================================
 
+/// Open the MIDI client the health check loop keeps for its port scans.
+///
+/// Hotplug behaviour per midir backend:
+/// - ALSA: `ports()` walks the sequencer's client/port list on every call,
+///   so a long-lived client sees devices come and go.
+/// - WinMM: `ports()` calls `midiInGetNumDevs`/`midiInGetDevCaps`, which
+///   reflect the current system device list regardless of client age.
+/// - CoreMIDI: a client's view of sources is refreshed by setup-change
+///   notifications delivered through a run loop, which the health thread
+///   doesn't run. Returns `None` there so each scan opens a fresh client.
+fn open_health_midi_client() -> Option<midir::MidiInput> {
+    #[cfg(target_os = "macos")]
+    {
+        None
+    }
+    #[cfg(not(target_os = "macos"))]
+    {
+        midir::MidiInput::new("sacho-health").ok()
+    }
+}
+
 /// Enumerate currently-connected MIDI port names (lightweight, no device details).
-fn enumerate_midi_port_names() -> HashSet<String> {
-    let mut names = HashSet::new();
-    if let Ok(midi_in) = midir::MidiInput::new("sacho-health") {
-        let ports = midi_in.ports();
-        for port in &ports {
-            if let Ok(name) = midi_in.port_name(port) {
-                names.insert(name);
+///
+/// Uses `midi_in` when given (the health loop's long-lived client); otherwise
+/// opens a temporary client for this one scan.
+fn enumerate_midi_port_names(midi_in: Option<&midir::MidiInput>) -> HashSet<String> {
+    let temp_client;
+    let midi_in = match midi_in {
+        Some(client) => client,
+        None => match midir::MidiInput::new("sacho-health") {
+            Ok(client) => {
+                temp_client = client;
+                &temp_client
             }
+            Err(_) => return HashSet::new(),
+        },
+    };
+    let mut names = HashSet::new();
+    for port in &midi_in.ports() {
+        if let Ok(name) = midi_in.port_name(port) {
+            names.insert(name);
         }
     }
     names
@@ -105,6 +137,15 @@ fn enumerate_video_device_names() -> HashSet<String> {
 ///
 /// Returns a set of device IDs that are disconnected.
 pub fn check_active_device_health(app: &AppHandle) -> HashSet<String> {
+    check_active_device_health_with(app, None)
+}
+
+/// Same as [`check_active_device_health`], scanning MIDI ports with the
+/// caller's long-lived client when one is given.
+fn check_active_device_health_with(
+    app: &AppHandle,
+    midi_in: Option<&midir::MidiInput>,
+) -> HashSet<String> {
     let config = app.state::<RwLock<Config>>();
     let config = config.read();
     let device_manager = app.state::<RwLock<DeviceManager>>();
@@ -139,7 +180,7 @@ pub fn check_active_device_health(app: &AppHandle) -> HashSet<String> {
     // Check MIDI devices: IDs are "midi-{index}", names come from DeviceManager cache.
     // We enumerate current port names and check if the cached name is still present.
     if !active_midi_ids.is_empty() {
-        let current_midi_names = enumerate_midi_port_names();
+        let current_midi_names = enumerate_midi_port_names(midi_in);
         for id in &active_midi_ids {
             // Find the cached name for this ID
             if let Some(device) = dm.midi_devices.iter().find(|d| &d.id == id) {
@@ -243,6 +284,9 @@ pub fn health_check_loop(
     let mut video_stall: HashMap<String, VideoStallState> = HashMap::new();
     // Tick counter for rate-limiting video reconnection enumeration
     let mut tick_count: u32 = 0;
+    // MIDI client reused across ticks (opening one every second is not cheap);
+    // dropped when the loop exits
+    let health_midi_input = open_health_midi_client();
 
     println!("[Health] Device health checker started");
 
@@ -254,7 +298,8 @@ pub fn health_check_loop(
         }
 
         // Check MIDI + audio via enumeration
-        let mut current_disconnected = check_active_device_health(&app);
+        let mut current_disconnected =
+            check_active_device_health_with(&app, health_midi_input.as_ref());
 
         // Skip video stall detection while pipelines are intentionally stopped
         // (e.g. during encoder test or auto-select). The test commands set status
@@ -10,9 +10,10 @@
 //! - Thread-safe operation with proper synchronization
 //! - Modular architecture for adding new encoder backends
 
-use crossbeam_channel::{bounded, Receiver, Sender, TrySendError};
+use crossbeam_channel::{bounded, Receiver, Sender, TryRecvError, TrySendError};
 use parking_lot::Mutex;
 use std::path::PathBuf;
+use std::sync::atomic::{AtomicBool, AtomicU64, AtomicUsize, Ordering};
 use std::sync::Arc;
 use std::time::{Duration, Instant};
 
@@ -43,6 +44,13 @@ pub enum EncoderError {
 
 pub type Result<T> = std::result::Result<T, EncoderError>;
 
+/// Maximum number of queued frames handed to appsrc in a single BufferList.
+const MAX_PUSH_BATCH: usize = 32;
+
+/// filesink buffer size for the post-recording remux. The remux rewrites the
+/// whole recording in one sequential pass, so large writes beat the 64 KiB default.
+const REMUX_WRITE_BUFFER_BYTES: u32 = 4 * 1024 * 1024;
+
 /// Represents a raw video frame to be encoded
 #[derive(Clone)]
 pub struct RawVideoFrame {
@@ -96,6 +104,10 @@ pub struct EncoderConfig {
     pub target_height: Option<u32>,
     /// Target encoding fps (if different from source, videorate is inserted)
     pub target_fps: Option<f64>,
+    /// Keep encoder output delay minimal (no B-frames, lookahead or
+    /// multi-pass). Set for the continuous pre-roll encoder, whose output
+    /// is cut over to the recording without a flush.
+    pub low_latency: bool,
 }
 
 impl Default for EncoderConfig {
@@ -109,6 +121,7 @@ impl Default for EncoderConfig {
             target_width: None,
             target_height: None,
             target_fps: None,
+            low_latency: false,
         }
     }
 }
@@ -563,23 +576,50 @@ pub struct AsyncVideoEncoder {
     #[allow(dead_code)]
     hw_type: HardwareEncoderType,
     /// Shared state for checking encoder status
-    state: Arc<Mutex<EncoderState>>,
+    state: Arc<EncoderState>,
+    /// Frames sent but not yet picked up by the encoder thread
+    queued_frames: Arc<AtomicUsize>,
+    /// Maximum frames allowed in `queued_frames` (backpressure limit)
+    buffer_size: usize,
 }
 
 /// Messages sent to the encoder thread
 enum EncoderMessage {
-    /// A frame to encode
-    Frame(RawVideoFrame),
+    /// A run of consecutive frames to encode. `metered` frames were counted
+    /// in `queued_frames` and are subtracted from it on receipt.
+    Frames {
+        frames: Vec<RawVideoFrame>,
+        metered: bool,
+    },
     /// Flush and finalize the output
     Finish,
 }
 
 /// Encoder state shared between threads
+///
+/// Each field is synchronized on its own: the counters are atomics the
+/// encoder thread can publish without a lock, and only the (rarely set)
+/// error message sits behind a mutex.
 struct EncoderState {
-    frames_encoded: u64,
-    bytes_written: u64,
-    is_finished: bool,
-    last_error: Option<String>,
+    frames_encoded: AtomicU64,
+    bytes_written: AtomicU64,
+    is_finished: AtomicBool,
+    /// Set (with Release) after `last_error` is filled in, so producers can
+    /// check for failure on every send without taking the mutex
+    has_failed: AtomicBool,
+    last_error: Mutex<Option<String>>,
+}
+
+impl EncoderState {
+    fn new() -> Self {
+        Self {
+            frames_encoded: AtomicU64::new(0),
+            bytes_written: AtomicU64::new(0),
+            is_finished: AtomicBool::new(false),
+            has_failed: AtomicBool::new(false),
+            last_error: Mutex::new(None),
+        }
+    }
 }
 
 /// Statistics from encoding session
@@ -624,14 +664,12 @@ impl AsyncVideoEncoder {
         // Create bounded channel for frames (provides backpressure)
         let (frame_sender, frame_receiver) = bounded::<EncoderMessage>(buffer_size);
 
-        let state = Arc::new(Mutex::new(EncoderState {
-            frames_encoded: 0,
-            bytes_written: 0,
-            is_finished: false,
-            last_error: None,
-        }));
+        let state = Arc::new(EncoderState::new());
+
+        let queued_frames = Arc::new(AtomicUsize::new(0));
 
         let state_clone = state.clone();
+        let queued_clone = queued_frames.clone();
         let config_clone = config.clone();
 
         // Spawn encoder thread
@@ -640,6 +678,7 @@ impl AsyncVideoEncoder {
             .spawn(move || {
                 Self::encoder_thread_main(
                     frame_receiver,
+                    queued_clone,
                     output_path,
                     width,
                     height,
@@ -659,6 +698,8 @@ impl AsyncVideoEncoder {
             config,
             hw_type,
             state,
+            queued_frames,
+            buffer_size,
         })
     }
 
@@ -682,14 +723,12 @@ impl AsyncVideoEncoder {
 
         let (frame_sender, frame_receiver) = bounded::<EncoderMessage>(buffer_size);
 
-        let state = Arc::new(Mutex::new(EncoderState {
-            frames_encoded: 0,
-            bytes_written: 0,
-            is_finished: false,
-            last_error: None,
-        }));
+        let state = Arc::new(EncoderState::new());
+
+        let queued_frames = Arc::new(AtomicUsize::new(0));
 
         let state_clone = state.clone();
+        let queued_clone = queued_frames.clone();
         let config_clone = config.clone();
 
         let encoder_thread = std::thread::Builder::new()
@@ -697,6 +736,7 @@ impl AsyncVideoEncoder {
             .spawn(move || {
                 Self::encoder_thread_main(
                     frame_receiver,
+                    queued_clone,
                     output_path,
                     width,
                     height,
@@ -716,6 +756,8 @@ impl AsyncVideoEncoder {
             config,
             hw_type,
             state,
+            queued_frames,
+            buffer_size,
         })
     }
 
@@ -724,21 +766,39 @@ impl AsyncVideoEncoder {
     /// Returns `Ok(true)` if frame was accepted, `Ok(false)` if buffer is full
     /// (frame was dropped), or `Err` if encoder has failed.
     pub fn try_send_frame(&self, frame: RawVideoFrame) -> Result<bool> {
-        // Check for encoder error first
-        {
-            let state = self.state.lock();
-            if let Some(ref err) = state.last_error {
-                return Err(EncoderError::Pipeline(err.clone()));
-            }
+        self.try_send_frames(vec![frame]).map(|accepted| accepted == 1)
+    }
+
+    /// Send a run of frames to be encoded as a single message (non-blocking)
+    ///
+    /// Frames are accepted in order until the backpressure limit is reached;
+    /// the rest are dropped. Returns the number of frames accepted, or `Err`
+    /// if encoder has failed.
+    pub fn try_send_frames(&self, mut frames: Vec<RawVideoFrame>) -> Result<usize> {
+        self.check_error()?;
+
+        let room = self
+            .buffer_size
+            .saturating_sub(self.queued_frames.load(Ordering::Acquire));
+        frames.truncate(room);
+        if frames.is_empty() {
+            // Buffer full (or nothing to send), frames will be dropped
+            return Ok(0);
         }
 
-        match self.frame_sender.try_send(EncoderMessage::Frame(frame)) {
-            Ok(()) => Ok(true),
+        let accepted = frames.len();
+        self.queued_frames.fetch_add(accepted, Ordering::AcqRel);
+        match self.frame_sender.try_send(EncoderMessage::Frames {
+            frames,
+            metered: true,
+        }) {
+            Ok(()) => Ok(accepted),
             Err(TrySendError::Full(_)) => {
-                // Buffer full, frame will be dropped
-                Ok(false)
+                self.queued_frames.fetch_sub(accepted, Ordering::AcqRel);
+                Ok(0)
             }
             Err(TrySendError::Disconnected(_)) => {
+                self.queued_frames.fetch_sub(accepted, Ordering::AcqRel);
                 Err(EncoderError::Channel("Encoder thread disconnected".into()))
             }
         }
@@ -746,19 +806,42 @@ impl AsyncVideoEncoder {
 
     /// Send a frame to be encoded (blocking if buffer is full)
     pub fn send_frame(&self, frame: RawVideoFrame) -> Result<()> {
-        // Check for encoder error first
-        {
-            let state = self.state.lock();
-            if let Some(ref err) = state.last_error {
-                return Err(EncoderError::Pipeline(err.clone()));
-            }
+        self.send_frames(vec![frame])
+    }
+
+    /// Send a run of frames to be encoded as a single message
+    ///
+    /// All frames are accepted and are not counted against the backpressure
+    /// limit; only blocks if the channel itself is full. Used for pre-roll,
+    /// where the frames are already in memory and every one of them is
+    /// needed. Counting them would leave no room for live frames until the
+    /// encoder thread has started up and received the burst.
+    pub fn send_frames(&self, frames: Vec<RawVideoFrame>) -> Result<()> {
+        self.check_error()?;
+
+        if frames.is_empty() {
+            return Ok(());
         }
 
         self.frame_sender
-            .send(EncoderMessage::Frame(frame))
+            .send(EncoderMessage::Frames {
+                frames,
+                metered: false,
+            })
             .map_err(|_| EncoderError::Channel("Encoder thread disconnected".into()))
     }
 
+    /// Return the encoder thread's error, if it has failed
+    fn check_error(&self) -> Result<()> {
+        if !self.state.has_failed.load(Ordering::Acquire) {
+            return Ok(());
+        }
+        if let Some(ref err) = *self.state.last_error.lock() {
+            return Err(EncoderError::Pipeline(err.clone()));
+        }
+        Ok(())
+    }
+
     /// Finish encoding and wait for completion
     pub fn finish(mut self) -> Result<EncoderStats> {
         // Send finish message
@@ -776,25 +859,31 @@ impl AsyncVideoEncoder {
 
     /// Get current encoding statistics
     pub fn stats(&self) -> (u64, u64) {
-        let state = self.state.lock();
-        (state.frames_encoded, state.bytes_written)
+        (
+            self.state.frames_encoded.load(Ordering::Relaxed),
+            self.state.bytes_written.load(Ordering::Relaxed),
+        )
     }
 
     /// Check if the encoder has encountered an error
     pub fn has_error(&self) -> Option<String> {
-        self.state.lock().last_error.clone()
+        if !self.state.has_failed.load(Ordering::Acquire) {
+            return None;
+        }
+        self.state.last_error.lock().clone()
     }
 
     /// Main function for the encoder thread
     fn encoder_thread_main(
         receiver: Receiver<EncoderMessage>,
+        queued_frames: Arc<AtomicUsize>,
         output_path: PathBuf,
         width: u32,
         height: u32,
         fps: f64,
         config: EncoderConfig,
         hw_type: HardwareEncoderType,
-        state: Arc<Mutex<EncoderState>>,
+        state: Arc<EncoderState>,
     ) -> Result<EncoderStats> {
         let start_time = Instant::now();
 
@@ -848,13 +937,52 @@ impl AsyncVideoEncoder {
         // processing is complete and can start dropping genuinely stale frames.
         let mut live_mode = false;
 
+        // Frames already waiting in the channel are collected and handed to
+        // appsrc as one BufferList, so a pre-roll burst (or a backlog after a
+        // slow frame) costs one push instead of one per frame. Producers send
+        // each poll's frames as one message, so a batch may exceed
+        // MAX_PUSH_BATCH; we only stop pulling further messages once it does.
+        let mut pending: Vec<RawVideoFrame> = Vec::with_capacity(MAX_PUSH_BATCH);
+
         // Process frames from channel
         loop {
+            let mut finish = false;
             match receiver.recv() {
-                Ok(EncoderMessage::Frame(frame)) => {
+                Ok(EncoderMessage::Frames { frames, metered }) => {
+                    if metered {
+                        queued_frames.fetch_sub(frames.len(), Ordering::AcqRel);
+                    }
+                    pending.extend(frames);
+                }
+                Ok(EncoderMessage::Finish) => finish = true,
+                Err(_) => {
+                    // Channel closed, finish up
+                    break;
+                }
+            }
+            while !finish && pending.len() < MAX_PUSH_BATCH {
+                match receiver.try_recv() {
+                    Ok(EncoderMessage::Frames { frames, metered }) => {
+                        if metered {
+                            queued_frames.fetch_sub(frames.len(), Ordering::AcqRel);
+                        }
+                        pending.extend(frames);
+                    }
+                    Ok(EncoderMessage::Finish) => finish = true,
+                    Err(TryRecvError::Empty) => break,
+                    Err(TryRecvError::Disconnected) => finish = true,
+                }
+            }
+
+            // One clock read per batch; frame ages only need millisecond accuracy
+            let batch_time = Instant::now();
+            let mut list = gst::BufferList::new_sized(pending.len());
+            {
+                let list_ref = list.get_mut().unwrap();
+                for frame in pending.drain(..) {
                     // Drop frames that are too old (encoder can't keep up),
                     // but only after we've finished processing pre-roll frames.
-                    let age = frame.capture_time.elapsed();
+                    let age = batch_time.saturating_duration_since(frame.capture_time);
                     if age <= max_frame_age {
                         // Frame is fresh — pre-roll is done, enter live mode
                         live_mode = true;
@@ -892,36 +1020,40 @@ impl AsyncVideoEncoder {
                         last_pts_end = pts_end;
                     }
 
-                    // Push to encoder
-                    if let Err(e) = appsrc.push_buffer(buffer) {
-                        let err_msg = format!("Failed to push buffer: {:?}", e);
-                        state.lock().last_error = Some(err_msg.clone());
-                        return Err(EncoderError::Pipeline(err_msg));
-                    }
-
-                    frames_encoded += 1;
-                    state.lock().frames_encoded = frames_encoded;
+                    list_ref.add(buffer);
+                }
+            }
 
-                    // Log progress periodically
-                    if frames_encoded % 100 == 0 {
-                        println!(
-                            "[Encoder] Encoded {} frames ({} stale dropped)",
-                            frames_encoded, frames_dropped_stale
-                        );
-                    }
+            let batch_len = list.len() as u64;
+            if batch_len > 0 {
+                // Push to encoder
+                if let Err(e) = appsrc.push_buffer_list(list) {
+                    let err_msg = format!("Failed to push buffer list: {:?}", e);
+                    *state.last_error.lock() = Some(err_msg.clone());
+                    state.has_failed.store(true, Ordering::Release);
+                    return Err(EncoderError::Pipeline(err_msg));
                 }
-                Ok(EncoderMessage::Finish) => {
+
+                let previous = frames_encoded;
+                frames_encoded += batch_len;
+                state.frames_encoded.store(frames_encoded, Ordering::Relaxed);
+
+                // Log progress periodically
+                if frames_encoded / 100 != previous / 100 {
                     println!(
-                        "[Encoder] Finishing encoding ({} frames encoded, {} stale dropped)...",
+                        "[Encoder] Encoded {} frames ({} stale dropped)",
                         frames_encoded, frames_dropped_stale
                     );
-                    break;
-                }
-                Err(_) => {
-                    // Channel closed, finish up
-                    break;
                 }
             }
+
+            if finish {
+                println!(
+                    "[Encoder] Finishing encoding ({} frames encoded, {} stale dropped)...",
+                    frames_encoded, frames_dropped_stale
+                );
+                break;
+            }
         }
 
         // Send EOS and wait for pipeline to finish
@@ -990,12 +1122,9 @@ impl AsyncVideoEncoder {
         };
 
         // Update final state
-        {
-            let mut s = state.lock();
-            s.frames_encoded = frames_encoded;
-            s.bytes_written = bytes_written;
-            s.is_finished = true;
-        }
+        state.frames_encoded.store(frames_encoded, Ordering::Relaxed);
+        state.bytes_written.store(bytes_written, Ordering::Relaxed);
+        state.is_finished.store(true, Ordering::Release);
 
         println!(
             "[Encoder] Finished: {} frames, {} bytes, {:.1} fps, content: {:.2}s",
@@ -1065,6 +1194,8 @@ impl AsyncVideoEncoder {
 
         let filesink = gst::ElementFactory::make("filesink")
             .property("location", temp_path.to_string_lossy().to_string())
+            .property_from_str("buffer-mode", "full")
+            .property("buffer-size", REMUX_WRITE_BUFFER_BYTES)
             .build()
             .map_err(|e| EncoderError::Pipeline(format!("Failed to create filesink: {}", e)))?;
 
@@ -1276,8 +1407,11 @@ impl AsyncVideoEncoder {
             .build()
             .map_err(|e| EncoderError::Pipeline(format!("Failed to create queue: {}", e)))?;
 
-        // Video converter to handle any needed format conversion for encoder
+        // Video converter to handle any needed format conversion for encoder.
+        // Usually passthrough (frames arrive in the intermediate format); when it
+        // does convert, use all cores (n-threads=0).
         let videoconvert = gst::ElementFactory::make("videoconvert")
+            .property("n-threads", 0u32)
             .build()
             .map_err(|e| EncoderError::Pipeline(format!("Failed to create videoconvert: {}", e)))?;
 
@@ -1293,6 +1427,7 @@ impl AsyncVideoEncoder {
 
         if tw != width || th != height {
             let videoscale = gst::ElementFactory::make("videoscale")
+                .property("n-threads", 0u32)
                 .build()
                 .map_err(|e| {
                     EncoderError::Pipeline(format!("Failed to create videoscale: {}", e))
@@ -1423,6 +1558,7 @@ impl AsyncVideoEncoder {
             config.preset_level,
             config.effort_level,
             config.keyframe_interval,
+            config.low_latency,
         );
 
         Ok(encoder)
@@ -1502,6 +1638,7 @@ impl AsyncVideoEncoder {
             config.preset_level,
             config.effort_level,
             config.keyframe_interval,
+            config.low_latency,
         );
 
         Ok(encoder)
@@ -1581,6 +1718,7 @@ impl AsyncVideoEncoder {
             config.preset_level,
             config.effort_level,
             config.keyframe_interval,
+            config.low_latency,
         );
 
         Ok(encoder)
@@ -1653,6 +1791,7 @@ impl AsyncVideoEncoder {
             config.preset_level,
             config.effort_level,
             config.keyframe_interval,
+            config.low_latency,
         );
 
         Ok(encoder)
@@ -1708,6 +1847,7 @@ impl AsyncVideoEncoder {
             config.preset_level,
             config.effort_level,
             config.keyframe_interval,
+            config.low_latency,
         );
 
         Ok(encoder)
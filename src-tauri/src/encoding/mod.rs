@@ -308,6 +308,13 @@ pub fn is_raw_format(format: &str) -> bool {
     )
 }
 
+/// Returns true for pre-encoded formats that use inter-frame prediction
+/// (H264, AV1, VP8, VP9). Dropping a frame of these corrupts the picture
+/// until the next keyframe; MJPEG and raw formats are intra-only.
+pub fn is_inter_coded_format(format: &str) -> bool {
+    matches!(format, "H264" | "AV1" | "VP8" | "VP9")
+}
+
 /// Build GStreamer caps media-type and optional format field from a format string.
 ///
 /// Returns `(media_type, format_field)`:
@@ -348,6 +355,37 @@ pub fn decoder_for_format(format: &str) -> Option<&'static str> {
     }
 }
 
+/// Hardware MJPEG decoders, in order of preference. These plugins only register
+/// their elements when a usable device is present, so a registry hit is enough.
+#[cfg(not(target_os = "macos"))]
+const HW_MJPEG_DECODERS: &[&str] = &[
+    "nvjpegdec", // NVIDIA (nvcodec)
+    #[cfg(target_os = "windows")]
+    "qsvjpegdec", // Intel Quick Sync
+    #[cfg(target_os = "linux")]
+    "vajpegdec", // VA-API (Intel/AMD)
+];
+#[cfg(target_os = "macos")]
+const HW_MJPEG_DECODERS: &[&str] = &[];
+
+/// Returns the decoder element to use in a capture pipeline for a pre-encoded format.
+/// Same as `decoder_for_format`, except MJPEG prefers a hardware decoder when one
+/// is available — high-resolution MJPEG is otherwise decoded on the CPU for every frame.
+/// Hardware JPEG decoders reject some subsamplings/caps; `VideoCapturePipeline::start`
+/// falls back to `decoder_for_format` when negotiation fails.
+pub fn capture_decoder_for_format(format: &str) -> Option<&'static str> {
+    use gstreamer as gst;
+    if format == "MJPEG" {
+        if let Some(name) = HW_MJPEG_DECODERS
+            .iter()
+            .find(|name| gst::ElementFactory::find(name).is_some())
+        {
+            return Some(*name);
+        }
+    }
+    decoder_for_format(format)
+}
+
 /// Returns the GStreamer parser element name for a format.
 /// Only H264 and AV1 need a real parser; everything else uses identity.
 pub fn parser_for_format(format: &str) -> &'static str {
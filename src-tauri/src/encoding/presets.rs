@@ -78,6 +78,31 @@ fn try_set_u32_clamped(element: &gst::Element, name: &str, value: u32) -> bool {
     true
 }
 
+/// Set an optional tuning property, trying each alias in turn.
+///
+/// Property names differ between element generations (e.g. the newer nvcodec
+/// encoders use `b-frames` where legacy `nvh264enc` uses `bframes`). Logs a
+/// warning when none of the names exist so a missing tuning knob is visible
+/// instead of silently ignored.
+///
+/// Returns `true` if one of the properties was found and set.
+fn try_set_tuning(element: &gst::Element, names: &[&str], set: impl Fn(&str)) -> bool {
+    if let Some(name) = names.iter().find(|name| element.find_property(name).is_some()) {
+        set(name);
+        return true;
+    }
+    let element_name = element
+        .factory()
+        .map(|f| f.name().to_string())
+        .unwrap_or_default();
+    log::warn!(
+        "[Preset] {} has no {} property, skipping",
+        element_name,
+        names.join("/"),
+    );
+    false
+}
+
 /// Minimum preset level (lightest computational load)
 pub const MIN_PRESET: u8 = 1;
 /// Maximum preset level (highest quality, most intensive)
@@ -113,6 +138,8 @@ pub fn preset_label(level: u8) -> &'static str {
 /// * `level` — quality preset level (1–5; clamped internally)
 /// * `effort_level` — compute effort for software encoders (1–5; clamped internally)
 /// * `keyframe_interval` — keyframe interval in frames (0 = encoder default)
+/// * `low_latency` — avoid settings that hold frames inside the encoder
+///   (B-frames, lookahead, multi-pass)
 pub fn apply_preset(
     encoder: &gst::Element,
     codec: VideoCodec,
@@ -120,6 +147,7 @@ pub fn apply_preset(
     level: u8,
     effort_level: u8,
     keyframe_interval: u32,
+    low_latency: bool,
 ) {
     let level = level.clamp(MIN_PRESET, MAX_PRESET);
     let effort_level = effort_level.clamp(MIN_PRESET, MAX_PRESET);
@@ -132,7 +160,7 @@ pub fn apply_preset(
     match (codec, hw_type) {
         // ── AV1 encoders ────────────────────────────────────────────────
         (VideoCodec::Av1, HardwareEncoderType::Nvenc) => {
-            apply_nvenc_av1(encoder, level, keyframe_interval);
+            apply_nvenc_av1(encoder, level, keyframe_interval, low_latency);
         }
         (VideoCodec::Av1, HardwareEncoderType::Amf) => {
             apply_amf_av1(encoder, level);
@@ -204,6 +232,14 @@ pub fn apply_preset(
 /// always improve quality distribution — especially for static scenes
 /// where they redirect bits from flat backgrounds to moving subjects.
 ///
+/// Levels 4–5 also use the high-quality tune and, unless `low_latency` is
+/// set, B-frames and lookahead: the slower presets spend most of their time
+/// waiting on reference frames, and B-frames with a lookahead window keep
+/// the NVENC pipeline full while improving quality. Level 5 (p7) adds
+/// full-resolution two-pass and a stronger AQ. These hold ~20 frames inside
+/// the encoder, so the continuous pre-roll encoder (`low_latency`) skips
+/// them.
+///
 /// Properties used:
 /// - `preset`: p1 (fastest) to p7 (best quality)
 /// - `rc-mode`: VBR (enables const-quality)
@@ -211,7 +247,12 @@ pub fn apply_preset(
 /// - `spatial-aq`: adaptive quantization across spatial blocks
 /// - `temporal-aq`: adaptive quantization across frames
 /// - `gop-size`: keyframe interval
-fn apply_nvenc_av1(encoder: &gst::Element, level: u8, keyframe_interval: u32) {
+/// - `tune`: high-quality (levels 4–5)
+/// - `aq-strength`: AQ strength 1–15, 0 = auto (level 5)
+/// - `b-frames` (`bframes` on older elements): number of B-frames (guint, levels 4–5)
+/// - `rc-lookahead`: frames of lookahead for rate control (guint, levels 4–5)
+/// - `multi-pass`: disabled / two-pass-quarter / two-pass (level 5)
+fn apply_nvenc_av1(encoder: &gst::Element, level: u8, keyframe_interval: u32, low_latency: bool) {
     let (const_quality, preset) = match level {
         1 => (38.0f64, "p1"),
         2 => (32.0, "p3"),
@@ -228,6 +269,35 @@ fn apply_nvenc_av1(encoder: &gst::Element, level: u8, keyframe_interval: u32) {
     if keyframe_interval > 0 {
         encoder.set_property("gop-size", keyframe_interval as i32);
     }
+
+    if level < 4 {
+        return;
+    }
+    try_set_tuning(encoder, &["tune"], |name| {
+        encoder.set_property_from_str(name, "high-quality")
+    });
+    if level >= 5 {
+        try_set_tuning(encoder, &["aq-strength"], |name| {
+            try_set_u32_clamped(encoder, name, 8);
+        });
+    }
+    if low_latency {
+        return;
+    }
+    let (bframes, lookahead, multi_pass) = match level {
+        4 => (2u32, 10u32, "disabled"),
+        _ => (3, 20, "two-pass"),
+    };
+    // nvav1enc (GstNvEncoder base) calls it `b-frames`; `bframes` is the legacy name
+    try_set_tuning(encoder, &["b-frames", "bframes"], |name| {
+        try_set_u32_clamped(encoder, name, bframes);
+    });
+    try_set_tuning(encoder, &["rc-lookahead"], |name| {
+        try_set_u32_clamped(encoder, name, lookahead);
+    });
+    try_set_tuning(encoder, &["multi-pass"], |name| {
+        encoder.set_property_from_str(name, multi_pass)
+    });
 }
 
 /// AMD AMF AV1 (amfav1enc) — RX 7000 series+
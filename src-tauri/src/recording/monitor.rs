@@ -1283,6 +1283,8 @@ pub struct MidiMonitor {
     video_poller_handle: Option<std::thread::JoinHandle<()>>,
     /// Handle for the idle checker background thread
     idle_checker_handle: Option<std::thread::JoinHandle<()>>,
+    /// Dropped on stop to wake the idle checker out of its timed wait
+    idle_checker_wake: Option<crossbeam_channel::Sender<()>>,
     /// Handle for the audio level poller background thread
     audio_level_poller_handle: Option<std::thread::JoinHandle<()>>,
     /// Per-thread stop flags for selective pipeline restart
@@ -1315,6 +1317,7 @@ impl MidiMonitor {
             video_manager: Arc::new(Mutex::new(VideoCaptureManager::new(pre_roll_secs))),
             video_poller_handle: None,
             idle_checker_handle: None,
+            idle_checker_wake: None,
             audio_level_poller_handle: None,
             video_poller_stop: Arc::new(AtomicBool::new(false)),
             idle_checker_stop: Arc::new(AtomicBool::new(false)),
@@ -1456,13 +1459,8 @@ impl MidiMonitor {
                             }
 
                             // Check for note-on to trigger recording
-                            if message.len() >= 3 {
-                                let status = message[0] & 0xF0;
-                                let velocity = message[2];
-
-                                if status == 0x90 && velocity > 0 {
-                                    handle_trigger(&app_handle, &last_event_time, &capture_state, &video_manager);
-                                }
+                            if is_note_on(message) {
+                                handle_trigger(&app_handle, &last_event_time, &capture_state, &video_manager);
                             }
                         },
                         (),
@@ -1506,11 +1504,8 @@ impl MidiMonitor {
                             let mut state = capture_state.lock();
 
                             // Update last event time for idle detection (even during pre-roll)
-                            if message.len() >= 3 {
-                                let status = message[0] & 0xF0;
-                                if status == 0x90 || status == 0x80 {
-                                    *last_event_time.write() = Some(Instant::now());
-                                }
+                            if is_note_event(message) {
+                                *last_event_time.write() = Some(Instant::now());
                             }
 
                             // Use pre-roll if not recording OR if recording is starting (video init)
@@ -1761,18 +1756,41 @@ impl MidiMonitor {
         let handle = std::thread::Builder::new()
             .name("sacho-video-poller".into())
             .spawn(move || {
+                // Poll at ~100Hz on a fixed schedule so time spent inside poll()
+                // doesn't stretch the interval between drains.
+                let interval = Duration::from_millis(10);
+                // The FPS mismatch check measures over a 5 s window, so sampling
+                // it about once a second is plenty.
+                let fps_check_every = 100u32;
+                let mut tick = 0u32;
+                let mut next_poll = Instant::now();
                 while !stop_flag.load(Ordering::SeqCst) {
-                    {
+                    let warnings = {
                         let mut mgr = video_manager.lock();
                         mgr.poll();
 
                         // Check for FPS mismatch warnings
-                        let warnings = mgr.collect_fps_warnings();
-                        for warning in warnings {
-                            let _ = app_handle.emit("video-fps-warning", warning);
+                        if tick % fps_check_every == 0 {
+                            mgr.collect_fps_warnings()
+                        } else {
+                            Vec::new()
                         }
+                    };
+                    tick = tick.wrapping_add(1);
+
+                    // Emit outside the manager lock
+                    for warning in warnings {
+                        let _ = app_handle.emit("video-fps-warning", warning);
+                    }
+
+                    next_poll += interval;
+                    let now = Instant::now();
+                    if next_poll > now {
+                        std::thread::sleep(next_poll - now);
+                    } else {
+                        // Fell behind (e.g. a slow recording start); don't try to catch up
+                        next_poll = now;
                     }
-                    std::thread::sleep(Duration::from_millis(10)); // Poll at ~100Hz
                 }
             })
             .expect("Failed to spawn video poller thread");
@@ -1871,6 +1889,7 @@ impl MidiMonitor {
     /// Stop only the idle checker thread
     fn stop_idle_checker(&mut self) {
         self.idle_checker_stop.store(true, Ordering::SeqCst);
+        self.idle_checker_wake = None;
         if let Some(handle) = self.idle_checker_handle.take() {
             let _ = handle.join();
         }
@@ -2048,19 +2067,31 @@ impl MidiMonitor {
         let stop_flag = self.idle_checker_stop.clone();
         let capture_state = self.capture_state.clone();
         let video_manager = self.video_manager.clone();
+        let (wake_tx, wake_rx) = crossbeam_channel::bounded::<()>(0);
+        self.idle_checker_wake = Some(wake_tx);
 
         let handle = std::thread::Builder::new()
             .name("sacho-idle-checker".into())
             .spawn(move || {
+                // Instead of re-checking every second, sleep until the earliest
+                // moment the idle timeout could expire. The wait is cut short
+                // when the monitor drops `wake_tx` on stop.
+                let mut wait = Duration::from_secs(1);
                 loop {
-                    std::thread::sleep(Duration::from_secs(1));
+                    if let Err(crossbeam_channel::RecvTimeoutError::Disconnected) =
+                        wake_rx.recv_timeout(wait)
+                    {
+                        break;
+                    }
 
                     if stop_flag.load(Ordering::SeqCst) {
                         break;
                     }
+                    // Default re-check interval while not recording
+                    wait = Duration::from_secs(1);
                     
                     let config = app_handle.state::<RwLock<Config>>();
-                    let idle_timeout = config.read().idle_timeout_secs;
+                    let idle_timeout = Duration::from_secs(config.read().idle_timeout_secs as u64);
                     
                     let (is_recording, recording_started_at) = {
                         let state = capture_state.lock();
@@ -2072,15 +2103,22 @@ impl MidiMonitor {
                         // This prevents a stale last_event_time from immediately stopping
                         // a recording that took a while to initialize (e.g., slow camera)
                         if let Some(started_at) = recording_started_at {
-                            if started_at.elapsed() < Duration::from_secs(idle_timeout as u64) {
+                            let since_start = started_at.elapsed();
+                            if since_start < idle_timeout {
+                                wait = idle_timeout - since_start;
                                 continue;
                             }
                         }
 
                         if let Some(last_time) = *last_event_time.read() {
-                            if last_time.elapsed() >= Duration::from_secs(idle_timeout as u64) {
-                                println!("[Sacho] Idle timeout ({} sec), stopping recording", idle_timeout);
+                            let idle = last_time.elapsed();
+                            if idle >= idle_timeout {
+                                println!("[Sacho] Idle timeout ({} sec), stopping recording", idle_timeout.as_secs());
                                 stop_recording(&app_handle, &capture_state, &video_manager);
+                            } else {
+                                // A newer event may have arrived in the meantime;
+                                // that just pushes the next check further out.
+                                wait = idle_timeout - idle;
                             }
                         }
                     }
@@ -2099,6 +2137,18 @@ impl Drop for MidiMonitor {
     }
 }
 
+/// Note On with non-zero velocity (velocity 0 is a Note Off by convention)
+#[inline]
+fn is_note_on(message: &[u8]) -> bool {
+    matches!(message, [status, _, velocity, ..] if status & 0xF0 == 0x90 && *velocity > 0)
+}
+
+/// Note On or Note Off — the events that count as playing activity
+#[inline]
+fn is_note_event(message: &[u8]) -> bool {
+    matches!(message, [status, _, _, ..] if matches!(status & 0xF0, 0x80 | 0x90))
+}
+
 /// Handle trigger event (MIDI note-on or audio threshold exceeded)
 fn handle_trigger(
     app_handle: &AppHandle, 
@@ -2109,6 +2159,16 @@ fn handle_trigger(
     // Update last event time
     *last_event_time.write() = Some(Instant::now());
     
+    // Fast path: while a recording is running or starting, a trigger only needs
+    // to refresh the idle timer. Skip the app state lookups below, which would
+    // otherwise run for every note played during a take.
+    {
+        let state = capture_state.lock();
+        if state.is_recording || state.is_starting {
+            return;
+        }
+    }
+    
     // Check if the global recording state allows starting
     // (e.g., we're not in Initializing mode from a device config change)
     {
@@ -32,6 +32,8 @@ pub struct BufferedMidiEvent {
 pub struct MidiPrerollBuffer {
     events: VecDeque<BufferedMidiEvent>,
     max_duration: Duration,
+    /// Events buffered since the last drain/clear (for rate-limited logging)
+    events_pushed: u64,
 }
 
 impl MidiPrerollBuffer {
@@ -43,6 +45,7 @@ impl MidiPrerollBuffer {
         Self {
             events: VecDeque::new(),
             max_duration: Duration::from_secs(max_secs.min(limit) as u64),
+            events_pushed: 0,
         }
     }
     
@@ -55,16 +58,22 @@ impl MidiPrerollBuffer {
         self.trim();
     }
     
+    /// Buffer an event. Called from the MIDI input callback while the capture
+    /// state lock is held, so logging is rate-limited (first event, then every
+    /// 500th) to keep console I/O off the per-event path.
     pub fn push(&mut self, device_name: String, event: TimestampedMidiEvent, driver_timestamp_us: u64) {
+        self.events_pushed += 1;
+        if self.events_pushed == 1 || self.events_pushed % 500 == 0 {
+            println!("[Sacho PreRoll] Buffered MIDI event from {}, buffer size: {}, driver_ts: {}us ({} since last drain)", 
+                device_name, self.events.len() + 1, driver_timestamp_us, self.events_pushed);
+        }
         self.events.push_back(BufferedMidiEvent {
-            device_name: device_name.clone(),
+            device_name,
             event,
             wall_time: Instant::now(),
             driver_timestamp_us,
         });
         self.trim();
-        println!("[Sacho PreRoll] Buffered MIDI event from {}, buffer size: {}, driver_ts: {}us", 
-            device_name, self.events.len(), driver_timestamp_us);
     }
     
     fn trim(&mut self) {
@@ -88,6 +97,7 @@ impl MidiPrerollBuffer {
     /// If `audio_preroll_duration` is None, falls back to making the first event timestamp 0.
     pub fn drain_with_audio_sync(&mut self, audio_preroll_duration: Option<Duration>) -> Vec<(String, TimestampedMidiEvent)> {
         let events: Vec<_> = self.events.drain(..).collect();
+        self.events_pushed = 0;
         let now = Instant::now();
         
         println!("[Sacho PreRoll] Draining {} pre-roll MIDI events", events.len());
@@ -168,6 +178,7 @@ impl MidiPrerollBuffer {
     
     pub fn clear(&mut self) {
         self.events.clear();
+        self.events_pushed = 0;
     }
 
     /// Remove all buffered events from a specific device (on disconnect)
@@ -8,7 +8,7 @@
 // - Synchronization support with audio/MIDI streams
 
 use parking_lot::Mutex;
-use std::collections::HashMap;
+use std::collections::{HashMap, HashSet};
 use std::path::PathBuf;
 use std::sync::atomic::{AtomicBool, AtomicU64, Ordering};
 use std::sync::Arc;
@@ -53,6 +53,21 @@ pub enum VideoError {
 
 pub type Result<T> = std::result::Result<T, VideoError>;
 
+/// Maximum number of frames held in the leaky queue in front of the capture appsink.
+///
+/// The appsink callback only copies a frame into the pre-roll buffer, so the
+/// queue just needs to absorb scheduling jitter. Keeping it shallow means a
+/// stalled callback drops old frames instead of building up seconds of
+/// latency (which would also skew the wall-clock timestamps used for sync).
+const CAPTURE_QUEUE_MAX_BUFFERS: u32 = 4;
+
+/// Queue depth for passthrough of inter-coded formats (H264, AV1, VP8, VP9).
+///
+/// Frames go straight to the file, so a leaky drop of a delta frame corrupts
+/// the picture until the next keyframe. Keep ~2 s of slack so only a long
+/// stall drops frames; intra-only passthrough (MJPEG) uses the shallow queue.
+const PASSTHROUGH_INTER_QUEUE_MAX_BUFFERS: u32 = 60;
+
 /// Buffered video frame with timestamp
 #[derive(Clone)]
 pub struct BufferedFrame {
@@ -83,7 +98,14 @@ pub struct VideoPrerollBuffer {
     bytes_per_sec: usize,
     /// Maximum buffer size in bytes (to prevent unbounded memory usage)
     max_bytes: usize,
+    /// Allocated bytes held by buffered frames. Counts `capacity()` rather
+    /// than `len()`: recycled allocations keep the size of the largest frame
+    /// they ever held, which matters for variable-size MJPEG frames.
     current_bytes: usize,
+    /// Capacity of the evicted frame allocation last handed back by `push()`.
+    /// The appsink callback holds it until the next frame, so it counts
+    /// against `max_bytes` until then.
+    spare_bytes: usize,
 }
 
 impl VideoPrerollBuffer {
@@ -115,39 +137,59 @@ impl VideoPrerollBuffer {
             bytes_per_sec,
             max_bytes,
             current_bytes: 0,
+            spare_bytes: 0,
         }
     }
 
-    /// Push a new frame, trimming old frames if necessary
-    pub fn push(&mut self, frame: BufferedFrame) {
-        let frame_size = frame.data.len();
-        self.current_bytes += frame_size;
+    /// Push a new frame, trimming old frames if necessary.
+    ///
+    /// Returns the allocation of a trimmed frame, if any, so the caller can
+    /// copy the next frame into it instead of allocating. Steady-state
+    /// pre-roll then reuses one frame's storage rather than allocating and
+    /// freeing a full frame on every capture.
+    pub fn push(&mut self, frame: BufferedFrame) -> Option<Vec<u8>> {
+        // The caller's previous spare (if any) was used for this frame
+        self.spare_bytes = 0;
+        self.current_bytes += frame.data.capacity();
         self.frames.push_back(frame);
-        self.trim();
+        let spare = self.trim()?;
+        if self.current_bytes + spare.capacity() > self.max_bytes {
+            return None;
+        }
+        self.spare_bytes = spare.capacity();
+        Some(spare)
     }
 
     /// Trim old frames to stay within duration and memory limits.
     /// When max_duration is zero (pre-roll disabled), skip trimming entirely —
     /// the buffer acts purely as a staging area between the appsink callback
     /// and the poll thread, which drains it at ~100Hz.
-    fn trim(&mut self) {
+    ///
+    /// Returns the allocation of the first trimmed frame, if any.
+    fn trim(&mut self) -> Option<Vec<u8>> {
         if self.max_duration.is_zero() {
-            return;
+            return None;
         }
 
         let retention = self.max_duration + self.headroom;
         let cutoff = Instant::now() - retention;
 
         // Trim by time (retaining headroom beyond max_duration)
+        let mut spare = None;
         while let Some(front) = self.frames.front() {
-            if front.wall_time < cutoff || self.current_bytes > self.max_bytes {
+            if front.wall_time < cutoff || self.current_bytes + self.spare_bytes > self.max_bytes {
                 if let Some(removed) = self.frames.pop_front() {
-                    self.current_bytes = self.current_bytes.saturating_sub(removed.data.len());
+                    self.current_bytes =
+                        self.current_bytes.saturating_sub(removed.data.capacity());
+                    if spare.is_none() {
+                        spare = Some(removed.data);
+                    }
                 }
             } else {
                 break;
             }
         }
+        spare
     }
 
     /// Drain all frames from the buffer, trimmed to at most `max_duration`.
@@ -183,7 +225,7 @@ impl VideoPrerollBuffer {
         self.max_duration = Duration::from_secs(secs as u64);
         let total_secs = secs as f64 + self.headroom.as_secs_f64();
         self.max_bytes = (self.bytes_per_sec as f64 * total_secs) as usize;
-        self.trim();
+        let _ = self.trim();
     }
 
     /// Check if buffer is empty
@@ -278,6 +320,11 @@ pub struct VideoCapturePipeline {
     frames_at_last_check: u64,
     /// Whether we've already emitted a FPS mismatch warning
     fps_warning_emitted: bool,
+    /// Hardware MJPEG decoder in the chain, if one was picked. Swapped for
+    /// the software decoder if caps negotiation fails with it.
+    hw_decoder: Option<gst::Element>,
+    /// Set when `hw_decoder` failed to negotiate and was replaced
+    hw_decoder_failed: bool,
 }
 
 /// Generic video file writer that handles different codecs and containers
@@ -400,10 +447,12 @@ impl VideoWriter {
         })
     }
 
-    fn write_frame(&mut self, frame: &BufferedFrame, pts_offset: Option<u64>) -> Result<()> {
+    /// Write a frame to the muxer. Takes the frame by value so its data can be
+    /// wrapped in a `gst::Buffer` without copying.
+    fn write_frame(&mut self, frame: BufferedFrame, pts_offset: Option<u64>) -> Result<()> {
         let offset = pts_offset.unwrap_or(frame.pts);
         let normalized_pts = frame.pts.saturating_sub(offset);
-        let mut buffer = gst::Buffer::from_slice(frame.data.clone());
+        let mut buffer = gst::Buffer::from_slice(frame.data);
         {
             let buffer_ref = buffer.get_mut().expect("BUG: freshly created buffer has refcount > 1");
             buffer_ref.set_pts(gst::ClockTime::from_nseconds(normalized_pts));
@@ -537,7 +586,7 @@ impl PrerollEncoderOutput {
     fn push_encoded_frame(&mut self, frame: BufferedFrame) {
         if let Some(ref mut writer) = self.active_writer {
             // Recording active: write to file
-            if let Err(e) = writer.write_frame(&frame, self.pts_offset) {
+            if let Err(e) = writer.write_frame(frame, self.pts_offset) {
                 println!(
                     "[PrerollEncoder] Warning: Failed to write frame to writer: {}",
                     e
@@ -582,10 +631,22 @@ impl PrerollEncoderOutput {
         }
     }
 
-    /// Drain all buffered encoded frames (for recording start)
+    /// Drain buffered encoded frames for recording start, beginning at the
+    /// nearest keyframe at or before the start of the pre-roll window.
+    ///
+    /// `trim()` keeps up to one extra keyframe interval of headroom; frames
+    /// ahead of that keyframe are dropped here instead of being written.
     fn drain(&mut self) -> Vec<BufferedFrame> {
+        let start = Instant::now()
+            .checked_sub(self.max_duration)
+            .and_then(|cutoff| {
+                self.buffer
+                    .iter()
+                    .rposition(|f| !f.is_delta_unit && f.wall_time <= cutoff)
+            })
+            .unwrap_or(0);
         self.current_bytes = 0;
-        self.buffer.drain(..).collect()
+        self.buffer.drain(..).skip(start).collect()
     }
 
     /// Duration of buffered content
@@ -628,6 +689,7 @@ impl PrerollVideoEncoder {
         height: u32,
         fps: f64,
         target_codec: crate::encoding::VideoCodec,
+        encoder_type: Option<HardwareEncoderType>,
         preset_level: u8,
         effort_level: u8,
         video_bit_depth: Option<u8>,
@@ -640,10 +702,18 @@ impl PrerollVideoEncoder {
             detect_best_encoder_for_codec, AsyncVideoEncoder, EncoderConfig,
         };
 
-        let hw_type = detect_best_encoder_for_codec(target_codec)
-            .ok_or_else(|| VideoError::Pipeline(
-                format!("No encoder available for {}", target_codec.display_name())
-            ))?;
+        // Prefer the encoder the user configured for this device so the pre-roll
+        // session runs on the same hardware backend as the recording would.
+        // Only fall back to detection when nothing was configured.
+        let hw_type = match encoder_type {
+            Some(hw_type) => hw_type,
+            None => detect_best_encoder_for_codec(target_codec).ok_or_else(|| {
+                VideoError::Pipeline(format!(
+                    "No encoder available for {}",
+                    target_codec.display_name()
+                ))
+            })?,
+        };
         println!(
             "[PrerollEncoder] Using {} for {} encoding (pre-roll)",
             hw_type.display_name(),
@@ -660,6 +730,7 @@ impl PrerollVideoEncoder {
             target_width,
             target_height,
             target_fps,
+            low_latency: true,
         };
 
         // Create the common pipeline start (appsrc -> queue -> videoconvert [-> scale] [-> rate])
@@ -789,8 +860,9 @@ impl PrerollVideoEncoder {
 
     /// Push a raw frame to be encoded.
     /// Non-blocking: if the pipeline can't accept the frame, it is silently dropped.
-    fn push_frame(&self, frame: &BufferedFrame) {
-        let mut buffer = gst::Buffer::from_slice(frame.data.clone());
+    /// The frame's data is handed to GStreamer as-is (no copy).
+    fn push_frame(&self, frame: BufferedFrame) {
+        let mut buffer = gst::Buffer::from_slice(frame.data);
         {
             let buffer_ref = buffer.get_mut().expect("BUG: freshly created buffer has refcount > 1");
             buffer_ref.set_pts(gst::ClockTime::from_nseconds(frame.pts));
@@ -982,9 +1054,16 @@ impl VideoCapturePipeline {
             .build()
             .map_err(|e| VideoError::Pipeline(format!("Failed to create capsfilter: {}", e)))?;
 
-        // Queue for buffering
+        // Leaky queue: decouples the source thread from the appsink callback.
+        // Shallow for intra-only formats; deep for inter-coded ones, where a
+        // dropped delta frame would corrupt the recording until the next keyframe.
+        let queue_max_buffers = if crate::encoding::is_inter_coded_format(source_format) {
+            PASSTHROUGH_INTER_QUEUE_MAX_BUFFERS
+        } else {
+            CAPTURE_QUEUE_MAX_BUFFERS
+        };
         let queue = gst::ElementFactory::make("queue")
-            .property("max-size-buffers", 60u32)
+            .property("max-size-buffers", queue_max_buffers)
             .property_from_str("leaky", "downstream")
             .build()
             .map_err(|e| VideoError::Pipeline(format!("Failed to create queue: {}", e)))?;
@@ -1035,6 +1114,8 @@ impl VideoCapturePipeline {
         // Set up appsink callback to fill pre-roll buffer
         let preroll_clone = preroll_buffer.clone();
         let needs_frames_clone = needs_frames.clone();
+        // Trimmed frame allocation handed back by `VideoPrerollBuffer::push`
+        let mut spare: Vec<u8> = Vec::new();
         let frame_counter = Arc::new(std::sync::atomic::AtomicU64::new(0));
         let frame_counter_clone = frame_counter.clone();
         // Compute default frame duration from source fps (fallback when buffer lacks duration metadata)
@@ -1064,7 +1145,10 @@ impl VideoCapturePipeline {
                                     buffer.flags().contains(gst::BufferFlags::DELTA_UNIT);
 
                                 if let Ok(map) = buffer.map_readable() {
-                                    let data = map.as_slice().to_vec();
+                                    // Copy into the allocation recycled by the last push
+                                    let mut data = std::mem::take(&mut spare);
+                                    data.clear();
+                                    data.extend_from_slice(map.as_slice());
 
                                     let frame = BufferedFrame {
                                         data,
@@ -1074,7 +1158,9 @@ impl VideoCapturePipeline {
                                         pixel_format: None, // Pre-encoded, no pixel format
                                         is_delta_unit: is_delta,
                                     };
-                                    preroll_clone.lock().push(frame);
+                                    if let Some(recycled) = preroll_clone.lock().push(frame) {
+                                        spare = recycled;
+                                    }
                                 }
                             }
                             Ok(gst::FlowSuccess::Ok)
@@ -1128,6 +1214,8 @@ impl VideoCapturePipeline {
             fps_check_start: Instant::now(),
             frames_at_last_check: 0,
             fps_warning_emitted: false,
+            hw_decoder: None,
+            hw_decoder_failed: false,
         })
     }
 
@@ -1204,7 +1292,8 @@ impl VideoCapturePipeline {
         let mut elements: Vec<gst::Element> = vec![source.clone(), capsfilter.clone()];
 
         // Insert decoder if source is not raw
-        if let Some(decoder_name) = crate::encoding::decoder_for_format(source_format) {
+        let mut hw_decoder: Option<gst::Element> = None;
+        if let Some(decoder_name) = crate::encoding::capture_decoder_for_format(source_format) {
             // Workaround for GStreamer issue #1118: mfvideosrc (and ksvideosrc) may put
             // non-standard fields like colorimetry and pixel-aspect-ratio on image/jpeg
             // caps. jpegdec tries to preserve these in its output, causing colorimetry
@@ -1290,38 +1379,19 @@ impl VideoCapturePipeline {
                 })?;
             println!("[Video]   Inserting decoder: {}", decoder_name);
 
-            // Diagnostic: count buffers entering and leaving the decoder
-            let dec_name = decoder_name.to_string();
-            if let Some(sink_pad) = decoder.static_pad("sink") {
-                let counter = Arc::new(AtomicU64::new(0));
-                let counter_clone = counter.clone();
-                let name = dec_name.clone();
-                sink_pad.add_probe(gst::PadProbeType::BUFFER, move |_pad, _info| {
-                    let n = counter_clone.fetch_add(1, Ordering::Relaxed);
-                    if n < 3 {
-                        println!("[Video]   {} sink: received buffer #{}", name, n + 1);
-                    }
-                    gst::PadProbeReturn::Ok
-                });
-            }
-            if let Some(src_pad) = decoder.static_pad("src") {
-                let counter = Arc::new(AtomicU64::new(0));
-                let counter_clone = counter.clone();
-                let name = dec_name.clone();
-                src_pad.add_probe(gst::PadProbeType::BUFFER, move |_pad, _info| {
-                    let n = counter_clone.fetch_add(1, Ordering::Relaxed);
-                    if n < 3 {
-                        println!("[Video]   {} src: produced buffer #{}", name, n + 1);
-                    }
-                    gst::PadProbeReturn::Ok
-                });
-            }
+            Self::add_decoder_probes(&decoder, decoder_name);
 
+            if Some(decoder_name) != crate::encoding::decoder_for_format(source_format) {
+                hw_decoder = Some(decoder.clone());
+            }
             elements.push(decoder);
         }
 
-        // Video converter to normalize format
+        // Video converter to normalize format. This is the per-frame colour
+        // conversion/10-bit expansion for every raw capture, so spread it across
+        // all cores (n-threads=0) instead of videoconvert's single-thread default.
         let videoconvert = gst::ElementFactory::make("videoconvert")
+            .property("n-threads", 0u32)
             .build()
             .map_err(|e| VideoError::Pipeline(format!("Failed to create videoconvert: {}", e)))?;
         elements.push(videoconvert);
@@ -1347,9 +1417,9 @@ impl VideoCapturePipeline {
             })?;
         elements.push(output_capsfilter);
 
-        // Queue for buffering with larger size for raw video
+        // Shallow leaky queue: decouples decode/convert from the appsink callback
         let queue = gst::ElementFactory::make("queue")
-            .property("max-size-buffers", 30u32)
+            .property("max-size-buffers", CAPTURE_QUEUE_MAX_BUFFERS)
             .property("max-size-bytes", 100_000_000u32) // 100MB
             .property_from_str("leaky", "downstream")
             .build()
@@ -1405,6 +1475,8 @@ impl VideoCapturePipeline {
         // Set up appsink callback to fill pre-roll buffer
         let preroll_clone = preroll_buffer.clone();
         let needs_frames_clone = needs_frames.clone();
+        // Trimmed frame allocation handed back by `VideoPrerollBuffer::push`
+        let mut spare: Vec<u8> = Vec::new();
         let frame_counter = Arc::new(std::sync::atomic::AtomicU64::new(0));
         let frame_counter_clone = frame_counter.clone();
         // Compute default frame duration from source fps (fallback when buffer lacks duration metadata)
@@ -1430,24 +1502,25 @@ impl VideoCapturePipeline {
                                     .map(|t| t.nseconds())
                                     .unwrap_or(default_duration_ns);
 
-                                // Get pixel format from caps
-                                let pixel_format = sample
-                                    .caps()
-                                    .and_then(|caps| caps.structure(0))
-                                    .and_then(|s| s.get::<String>("format").ok());
-
                                 if let Ok(map) = buffer.map_readable() {
-                                    let data = map.as_slice().to_vec();
+                                    // Copy into the allocation recycled by the last push
+                                    let mut data = std::mem::take(&mut spare);
+                                    data.clear();
+                                    data.extend_from_slice(map.as_slice());
 
                                     let frame = BufferedFrame {
                                         data,
                                         pts,
                                         duration,
                                         wall_time: Instant::now(),
-                                        pixel_format: pixel_format.clone(),
+                                        // Fixed by the output capsfilter; the pipeline's
+                                        // `pixel_format` is used instead of a per-frame caps lookup
+                                        pixel_format: None,
                                         is_delta_unit: false, // Not relevant for raw capture
                                     };
-                                    preroll_clone.lock().push(frame);
+                                    if let Some(recycled) = preroll_clone.lock().push(frame) {
+                                        spare = recycled;
+                                    }
                                 }
                             }
                             Ok(gst::FlowSuccess::Ok)
@@ -1499,11 +1572,122 @@ impl VideoCapturePipeline {
             fps_check_start: Instant::now(),
             frames_at_last_check: 0,
             fps_warning_emitted: false,
+            hw_decoder,
+            hw_decoder_failed: false,
         })
     }
 
+    /// Diagnostic: count buffers entering and leaving the decoder
+    fn add_decoder_probes(decoder: &gst::Element, decoder_name: &str) {
+        let dec_name = decoder_name.to_string();
+        if let Some(sink_pad) = decoder.static_pad("sink") {
+            let counter = Arc::new(AtomicU64::new(0));
+            let counter_clone = counter.clone();
+            let name = dec_name.clone();
+            sink_pad.add_probe(gst::PadProbeType::BUFFER, move |_pad, _info| {
+                let n = counter_clone.fetch_add(1, Ordering::Relaxed);
+                if n < 3 {
+                    println!("[Video]   {} sink: received buffer #{}", name, n + 1);
+                }
+                gst::PadProbeReturn::Ok
+            });
+        }
+        if let Some(src_pad) = decoder.static_pad("src") {
+            let counter = Arc::new(AtomicU64::new(0));
+            let counter_clone = counter.clone();
+            let name = dec_name.clone();
+            src_pad.add_probe(gst::PadProbeType::BUFFER, move |_pad, _info| {
+                let n = counter_clone.fetch_add(1, Ordering::Relaxed);
+                if n < 3 {
+                    println!("[Video]   {} src: produced buffer #{}", name, n + 1);
+                }
+                gst::PadProbeReturn::Ok
+            });
+        }
+    }
+
+    /// Whether the hardware MJPEG decoder failed and was replaced by the software one
+    pub fn hw_decoder_failed(&self) -> bool {
+        self.hw_decoder_failed
+    }
+
+    /// Use the software decoder instead of the hardware MJPEG decoder (call before `start()`).
+    /// No-op if the pipeline has no hardware decoder.
+    pub fn use_software_decoder(&mut self) -> Result<()> {
+        self.replace_hw_decoder()
+    }
+
     /// Start the capture pipeline (begins filling pre-roll buffer)
+    ///
+    /// If a hardware MJPEG decoder fails to negotiate (some reject the
+    /// subsampling or caps a camera emits), retries once with the software decoder.
     pub fn start(&mut self) -> Result<()> {
+        match self.start_pipeline() {
+            Err(e) if self.hw_decoder.is_some() => {
+                println!(
+                    "[Video] Hardware JPEG decoder failed for {} ({}), retrying with software decoder",
+                    self.device_name, e
+                );
+                self.hw_decoder_failed = true;
+                self.replace_hw_decoder()?;
+                self.start_pipeline()
+            }
+            result => result,
+        }
+    }
+
+    /// Swap the hardware MJPEG decoder for the software one (pipeline must be stopped)
+    fn replace_hw_decoder(&mut self) -> Result<()> {
+        let Some(hw_decoder) = self.hw_decoder.take() else {
+            return Ok(());
+        };
+        let decoder_name = crate::encoding::decoder_for_format(&self.source_format)
+            .ok_or_else(|| {
+                VideoError::Pipeline(format!("No software decoder for {}", self.source_format))
+            })?;
+
+        self.pipeline.set_state(gst::State::Null)?;
+
+        let upstream = hw_decoder
+            .static_pad("sink")
+            .and_then(|pad| pad.peer())
+            .and_then(|pad| pad.parent_element());
+        let downstream = hw_decoder
+            .static_pad("src")
+            .and_then(|pad| pad.peer())
+            .and_then(|pad| pad.parent_element());
+        let (Some(upstream), Some(downstream)) = (upstream, downstream) else {
+            return Err(VideoError::Pipeline(
+                "Hardware decoder is not linked".to_string(),
+            ));
+        };
+
+        upstream.unlink(&hw_decoder);
+        hw_decoder.unlink(&downstream);
+        self.pipeline.remove(&hw_decoder).map_err(|e| {
+            VideoError::Pipeline(format!("Failed to remove hardware decoder: {}", e))
+        })?;
+
+        let decoder = gst::ElementFactory::make(decoder_name)
+            .build()
+            .map_err(|e| {
+                VideoError::Pipeline(format!(
+                    "Failed to create decoder {}: {}",
+                    decoder_name, e
+                ))
+            })?;
+        self.pipeline.add(&decoder).map_err(|e| {
+            VideoError::Pipeline(format!("Failed to add decoder {}: {}", decoder_name, e))
+        })?;
+        gst::Element::link_many([&upstream, &decoder, &downstream]).map_err(|e| {
+            VideoError::Pipeline(format!("Failed to link decoder {}: {}", decoder_name, e))
+        })?;
+        Self::add_decoder_probes(&decoder, decoder_name);
+        println!("[Video]   Replaced hardware decoder with {}", decoder_name);
+        Ok(())
+    }
+
+    fn start_pipeline(&mut self) -> Result<()> {
         self.pipeline.set_state(gst::State::Playing)?;
         println!("[Video] Started capture pipeline for {}", self.device_name);
 
@@ -1511,10 +1695,19 @@ impl VideoCapturePipeline {
         // USB cameras need time to initialize, especially after a pipeline restart
         // (camera device must be released and reacquired by the OS). Decoders like
         // jpegdec add further latency since they need actual data before negotiating
-        // output caps. Allow up to 20 attempts (5 seconds total).
+        // output caps. Allow up to 5 seconds total, checking every 25ms so a
+        // camera that negotiates quickly isn't held back by a coarse retry step
+        // (pipelines start one after another, so this adds up across devices).
+        let negotiate_start = Instant::now();
+        let negotiate_timeout = Duration::from_secs(5);
         let mut negotiated = false;
-        for attempt in 1..=20 {
-            std::thread::sleep(std::time::Duration::from_millis(250));
+        let mut attempt = 0u32;
+        // A hardware decoder that rejects the camera's JPEGs fails for good;
+        // stop waiting so start() can fall back without the full timeout
+        let mut hw_decoder_error = false;
+        while negotiate_start.elapsed() < negotiate_timeout {
+            attempt += 1;
+            std::thread::sleep(Duration::from_millis(25));
 
             if let Some(pad) = self.appsink.static_pad("sink") {
                 if let Some(caps) = pad.current_caps() {
@@ -1531,8 +1724,11 @@ impl VideoCapturePipeline {
                             .unwrap_or(30.0);
 
                         println!(
-                            "[Video]   Negotiated caps: {}x{} @ {:.2}fps (attempt {})",
-                            self.width, self.height, self.fps, attempt
+                            "[Video]   Negotiated caps: {}x{} @ {:.2}fps (after {:?})",
+                            self.width,
+                            self.height,
+                            self.fps,
+                            negotiate_start.elapsed()
                         );
 
                         negotiated = true;
@@ -1555,6 +1751,16 @@ impl VideoCapturePipeline {
                                 "[Video]   BUS ERROR (attempt {}): '{}': {} (debug: {:?})",
                                 attempt, src, err.error(), err.debug()
                             );
+                            if let Some(ref decoder) = self.hw_decoder {
+                                let from_decoder = err
+                                    .src()
+                                    .map_or(false, |s| s == decoder.upcast_ref::<gst::Object>());
+                                if from_decoder
+                                    || err.error().matches(gst::StreamError::NotNegotiated)
+                                {
+                                    hw_decoder_error = true;
+                                }
+                            }
                         }
                         gst::MessageView::Warning(warn) => {
                             let src = warn.src().map(|s| s.name().to_string()).unwrap_or_default();
@@ -1568,10 +1774,21 @@ impl VideoCapturePipeline {
                 }
             }
 
-            if attempt < 20 {
+            if hw_decoder_error {
                 println!(
-                    "[Video]   Cap negotiation attempt {}/20 failed for {}, retrying...",
-                    attempt, self.device_name
+                    "[Video]   Hardware decoder error for {} (after {:?}), giving up on it",
+                    self.device_name,
+                    negotiate_start.elapsed()
+                );
+                break;
+            }
+
+            // Log roughly every 250ms rather than on every check
+            if attempt % 10 == 0 {
+                println!(
+                    "[Video]   Caps not negotiated yet for {} ({:?}), retrying...",
+                    self.device_name,
+                    negotiate_start.elapsed()
                 );
             }
         }
@@ -1701,6 +1918,7 @@ impl VideoCapturePipeline {
                 self.height,
                 self.fps,
                 target_codec,
+                self.encoder_type,
                 self.preset_level,
                 self.effort_level,
                 self.video_bit_depth,
@@ -1813,6 +2031,7 @@ impl VideoCapturePipeline {
         // the first frame arriving in poll() will set it. This ensures MKV
         // timestamps always start at 0.
         self.pts_offset = preroll_frames.first().map(|f| f.pts);
+        let preroll_count = preroll_frames.len() as u64;
 
         // Handle raw vs pre-encoded video differently
         if self.encode_during_preroll && self.preroll_encoder_output.is_some() {
@@ -1858,7 +2077,8 @@ impl VideoCapturePipeline {
             output.pts_offset = pts_offset;
 
             // Write all pre-roll frames to the writer
-            for frame in &encoded_frames {
+            let encoded_count = encoded_frames.len() as u64;
+            for frame in encoded_frames {
                 if let Err(e) = writer.write_frame(frame, pts_offset) {
                     println!(
                         "[Video] Warning: Failed to write pre-roll encoded frame: {}",
@@ -1875,7 +2095,7 @@ impl VideoCapturePipeline {
             self.file_writer = None; // Writer is inside PrerollEncoderOutput
             self.recording_path = Some(output_path);
             self.recording_start = Some(Instant::now());
-            self.frames_written = encoded_frames.len() as u64;
+            self.frames_written = encoded_count;
             self.is_recording = true;
             self.needs_frames.store(true, Ordering::Relaxed);
             self.consecutive_full_drops = 0;
@@ -1919,6 +2139,7 @@ impl VideoCapturePipeline {
                 target_width: use_target_w,
                 target_height: use_target_h,
                 target_fps: use_target_fps,
+                low_latency: false,
             };
 
             // Create encoder with buffer size of ~2 seconds of frames for backpressure
@@ -1950,24 +2171,24 @@ impl VideoCapturePipeline {
                 .pixel_format
                 .clone()
                 .unwrap_or_else(|| "NV12".to_string());
-            for frame in &preroll_frames {
-                let raw_frame = RawVideoFrame {
-                    data: frame.data.clone(),
+            let raw_frames: Vec<RawVideoFrame> = preroll_frames
+                .into_iter()
+                .map(|frame| RawVideoFrame {
+                    data: frame.data,
                     pts: frame.pts,
                     duration: frame.duration,
                     width: self.width,
                     height: self.height,
                     format: frame
                         .pixel_format
-                        .clone()
                         .unwrap_or_else(|| pixel_format.clone()),
                     capture_time: frame.wall_time,
-                };
+                })
+                .collect();
 
-                // Use blocking send for pre-roll since we need all frames
-                if let Err(e) = encoder.send_frame(raw_frame) {
-                    println!("[Video] Warning: Failed to send pre-roll frame: {}", e);
-                }
+            // Send pre-roll as one message; we need all frames, so bypass backpressure
+            if let Err(e) = encoder.send_frames(raw_frames) {
+                println!("[Video] Warning: Failed to send pre-roll frames: {}", e);
             }
 
             self.raw_encoder = Some(encoder);
@@ -1982,7 +2203,7 @@ impl VideoCapturePipeline {
                 VideoWriter::new(&output_path, writer_codec, self.width, self.height, self.fps)?;
 
             // Write pre-roll frames
-            for frame in &preroll_frames {
+            for frame in preroll_frames {
                 writer.write_frame(frame, self.pts_offset)?;
             }
 
@@ -1992,7 +2213,7 @@ impl VideoCapturePipeline {
 
         self.recording_path = Some(output_path);
         self.recording_start = Some(Instant::now());
-        self.frames_written = preroll_frames.len() as u64;
+        self.frames_written = preroll_count;
         self.is_recording = true;
         self.needs_frames.store(true, Ordering::Relaxed);
         self.consecutive_full_drops = 0;
@@ -2024,7 +2245,7 @@ impl VideoCapturePipeline {
 
             // First, push remaining raw frames to the preroll encoder so they get encoded
             if let Some(ref encoder) = self.preroll_encoder {
-                for frame in &remaining_frames {
+                for frame in remaining_frames {
                     encoder.push_frame(frame);
                 }
             }
@@ -2054,26 +2275,33 @@ impl VideoCapturePipeline {
                 .unwrap_or_else(|| "NV12".to_string());
 
             // Send remaining frames to encoder
-            for frame in &remaining_frames {
-                let raw_frame = RawVideoFrame {
-                    data: frame.data.clone(),
+            let remaining_count = remaining_frames.len() as u64;
+            let raw_frames: Vec<RawVideoFrame> = remaining_frames
+                .into_iter()
+                .map(|frame| RawVideoFrame {
+                    data: frame.data,
                     pts: frame.pts,
                     duration: frame.duration,
                     width: self.width,
                     height: self.height,
                     format: frame
                         .pixel_format
-                        .clone()
                         .unwrap_or_else(|| pixel_format.clone()),
                     capture_time: frame.wall_time,
-                };
+                })
+                .collect();
 
-                // Use non-blocking send, drop frames if encoder can't keep up
-                if let Ok(false) = encoder.try_send_frame(raw_frame) {
-                    println!("[Video] Warning: Dropped frame during stop (encoder backpressure)");
+            // Use non-blocking send, drop frames if encoder can't keep up
+            if let Ok(accepted) = encoder.try_send_frames(raw_frames) {
+                let dropped = remaining_count - accepted as u64;
+                if dropped > 0 {
+                    println!(
+                        "[Video] Warning: Dropped {} frames during stop (encoder backpressure)",
+                        dropped
+                    );
                 }
             }
-            self.frames_written += remaining_frames.len() as u64;
+            self.frames_written += remaining_count;
 
             // Finish encoding
             let stats = encoder
@@ -2083,10 +2311,10 @@ impl VideoCapturePipeline {
             (stats.content_duration, stats.bytes_written)
         } else if let Some(mut writer) = self.file_writer.take() {
             // Pre-encoded video
-            for frame in &remaining_frames {
+            self.frames_written += remaining_frames.len() as u64;
+            for frame in remaining_frames {
                 let _ = writer.write_frame(frame, self.pts_offset);
             }
-            self.frames_written += remaining_frames.len() as u64;
 
             writer.finish()?
         } else {
@@ -2271,7 +2499,7 @@ impl VideoCapturePipeline {
         if self.encode_during_preroll && self.preroll_encoder.is_some() {
             if let Some(ref encoder) = self.preroll_encoder {
                 let frames = self.preroll_buffer.lock().drain();
-                for frame in &frames {
+                for frame in frames {
                     encoder.push_frame(frame);
                 }
             }
@@ -2291,40 +2519,39 @@ impl VideoCapturePipeline {
                 .pixel_format
                 .clone()
                 .unwrap_or_else(|| "NV12".to_string());
-            let mut frames_sent = 0u64;
-            let mut frames_dropped = 0u64;
-
-            for frame in &frames {
-                let raw_frame = RawVideoFrame {
-                    data: frame.data.clone(),
+            let frames_polled = frames.len();
+            let raw_frames: Vec<RawVideoFrame> = frames
+                .into_iter()
+                .map(|frame| RawVideoFrame {
+                    data: frame.data,
                     pts: frame.pts,
                     duration: frame.duration,
                     width: self.width,
                     height: self.height,
                     format: frame
                         .pixel_format
-                        .clone()
                         .unwrap_or_else(|| pixel_format.clone()),
                     capture_time: frame.wall_time,
-                };
+                })
+                .collect();
 
-                // Use non-blocking send to avoid blocking capture
-                match encoder.try_send_frame(raw_frame) {
-                    Ok(true) => frames_sent += 1,
-                    Ok(false) => frames_dropped += 1, // Buffer full, frame dropped
-                    Err(e) => {
-                        println!("[Video] Encoder error: {}", e);
-                        return Err(VideoError::Pipeline(format!("Encoder error: {}", e)));
-                    }
+            // Use non-blocking send to avoid blocking capture. The whole poll
+            // goes over as one message; frames past the backpressure limit are dropped.
+            let frames_sent = match encoder.try_send_frames(raw_frames) {
+                Ok(accepted) => accepted as u64,
+                Err(e) => {
+                    println!("[Video] Encoder error: {}", e);
+                    return Err(VideoError::Pipeline(format!("Encoder error: {}", e)));
                 }
-            }
+            };
+            let frames_dropped = frames_polled as u64 - frames_sent;
 
             self.frames_written += frames_sent;
             self.total_frames_dropped += frames_dropped;
 
             if frames_dropped > 0 {
                 // Track consecutive polls where ALL frames were dropped (encoder stalled)
-                if frames_sent == 0 && !frames.is_empty() {
+                if frames_sent == 0 && frames_polled > 0 {
                     self.consecutive_full_drops += 1;
                 } else {
                     self.consecutive_full_drops = 0;
@@ -2352,7 +2579,7 @@ impl VideoCapturePipeline {
                         "Encoder stalled, recording aborted".to_string(),
                     ));
                 }
-            } else if !frames.is_empty() {
+            } else if frames_polled > 0 {
                 self.consecutive_full_drops = 0;
             }
         } else if let Some(ref mut writer) = self.file_writer {
@@ -2363,10 +2590,10 @@ impl VideoCapturePipeline {
                     self.pts_offset = Some(first.pts);
                 }
             }
-            for frame in &frames {
+            self.frames_written += frames.len() as u64;
+            for frame in frames {
                 writer.write_frame(frame, self.pts_offset)?;
             }
-            self.frames_written += frames.len() as u64;
         }
 
         Ok(())
@@ -2389,6 +2616,9 @@ pub struct VideoCaptureManager {
     is_recording: bool,
     /// Whether to encode video during pre-roll (encoding pipelines only)
     encode_during_preroll: bool,
+    /// Devices whose hardware MJPEG decoder failed to negotiate; later
+    /// pipelines for them go straight to the software decoder
+    hw_decoder_failed_devices: HashSet<String>,
 }
 
 impl VideoCaptureManager {
@@ -2404,6 +2634,7 @@ impl VideoCaptureManager {
             pre_roll_secs,
             is_recording: false,
             encode_during_preroll: false,
+            hw_decoder_failed_devices: HashSet::new(),
         }
     }
 
@@ -2488,7 +2719,19 @@ impl VideoCaptureManager {
                         pipeline.target_fps = resolved.target_fps;
                         pipeline.effort_level = dev_config.effort_level;
                     }
-                    if let Err(e) = pipeline.start() {
+                    if self.hw_decoder_failed_devices.contains(device_id) {
+                        if let Err(e) = pipeline.use_software_decoder() {
+                            println!(
+                                "[Video] Failed to switch {} to software decoder: {}",
+                                device_id, e
+                            );
+                        }
+                    }
+                    let start_result = pipeline.start();
+                    if pipeline.hw_decoder_failed() {
+                        self.hw_decoder_failed_devices.insert(device_id.clone());
+                    }
+                    if let Err(e) = start_result {
                         println!("[Video] Failed to start pipeline for {}: {}", device_id, e);
                         continue;
                     }
@@ -2522,9 +2765,7 @@ impl VideoCaptureManager {
             return Err(VideoError::Pipeline("Already recording".to_string()));
         }
 
-        let mut max_preroll = Duration::ZERO;
-
-        for (device_id, pipeline) in self.pipelines.iter_mut() {
+        let results = self.for_each_pipeline_parallel(|device_id, pipeline| {
             println!("[Video] Processing recording start for: {}", device_id);
 
             let safe_name = crate::session::sanitize_device_name(&pipeline.device_name);
@@ -2535,7 +2776,12 @@ impl VideoCaptureManager {
 
             let output_path = session_path.join(&filename);
 
-            match pipeline.start_recording(output_path) {
+            pipeline.start_recording(output_path)
+        });
+
+        let mut max_preroll = Duration::ZERO;
+        for (device_id, result) in results {
+            match result {
                 Ok(preroll_duration) => {
                     if preroll_duration > max_preroll {
                         max_preroll = preroll_duration;
@@ -2553,10 +2799,12 @@ impl VideoCaptureManager {
 
     /// Stop recording on all active pipelines
     pub fn stop_recording(&mut self) -> Vec<VideoFileInfo> {
-        let mut video_files = Vec::new();
+        let results =
+            self.for_each_pipeline_parallel(|_, pipeline| pipeline.stop_recording());
 
-        for (device_id, pipeline) in self.pipelines.iter_mut() {
-            match pipeline.stop_recording() {
+        let mut video_files = Vec::new();
+        for (device_id, result) in results {
+            match result {
                 Ok(info) => {
                     video_files.push(info);
                 }
@@ -2570,6 +2818,46 @@ impl VideoCaptureManager {
         video_files
     }
 
+    /// Run `f` on every pipeline, one thread per pipeline.
+    ///
+    /// Each device has its own encoder session, so starting or stopping
+    /// recordings one after another only makes the last device wait on the
+    /// others' pre-roll flush, encoder drain and remux.
+    fn for_each_pipeline_parallel<T, F>(&mut self, f: F) -> Vec<(String, Result<T>)>
+    where
+        T: Send,
+        F: Fn(&str, &mut VideoCapturePipeline) -> Result<T> + Sync,
+    {
+        if self.pipelines.len() <= 1 {
+            return self
+                .pipelines
+                .iter_mut()
+                .map(|(device_id, pipeline)| (device_id.clone(), f(device_id, pipeline)))
+                .collect();
+        }
+
+        let f = &f;
+        std::thread::scope(|s| {
+            let handles: Vec<_> = self
+                .pipelines
+                .iter_mut()
+                .map(|(device_id, pipeline)| {
+                    (device_id.clone(), s.spawn(move || f(device_id, pipeline)))
+                })
+                .collect();
+
+            handles
+                .into_iter()
+                .map(|(device_id, handle)| {
+                    let result = handle.join().unwrap_or_else(|_| {
+                        Err(VideoError::Pipeline("Pipeline thread panicked".to_string()))
+                    });
+                    (device_id, result)
+                })
+                .collect()
+        })
+    }
+
     /// Poll all pipelines (call from background thread)
     pub fn poll(&mut self) {
         for (_, pipeline) in self.pipelines.iter_mut() {